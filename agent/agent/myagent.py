@@ -18,23 +18,251 @@ DataRobot AutoML/MLOps Agent
 ユーザーの自然言語による指示に基づいて機械学習ワークフローを実行します。
 さらに、DataRobotのDSと同等の観点でモデルレビューを実施します。
 """
+import asyncio
+import hashlib
+import logging
+import textwrap
+from collections import deque
 from datetime import datetime
-from typing import Any, Mapping, cast
+from functools import cached_property, lru_cache
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Mapping, cast
 
+import orjson
 from datarobot_genai.core.agents import make_system_prompt
 from datarobot_genai.langgraph.agent import LangGraphAgent
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_litellm.chat_models import ChatLiteLLM
+from langchain_core.tools import BaseTool, StructuredTool
+from langgraph.cache.memory import InMemoryCache
 from langgraph.graph import END, START, MessagesState, StateGraph
-from langgraph.prebuilt import create_react_agent
-from langgraph.types import Command
-from openai.types.chat import CompletionCreateParams
+from langgraph.types import CachePolicy, Command
+
+# 重量級モジュール（litellm / langchain_litellm / langgraph.prebuilt /
+# openai.types）はコールドスタート短縮のため使用箇所で遅延インポートする
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langchain_litellm.chat_models import ChatLiteLLM
+    from openai.types.chat import CompletionCreateParams
+    from tiktoken import Encoding
 
 from agent.config import Config
-from agent.prompts import DATAROBOT_EXPERT_PROMPT
+from agent.prompts import CURRENT_DATETIME_PROMPT, DATAROBOT_EXPERT_PROMPT
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """プロセス内で共有する Config のシングルトンを取得
+
+    Config は BaseSettings 由来で生成時に環境変数等を再読込するため、
+    一度だけ生成してキャッシュします。
+    """
+    return Config()
+
+
+config = get_config()
+
+# llm() のホットパスで Pydantic の属性アクセスを繰り返さないための
+# スナップショット（いずれもプロセス内で変化しない設定値）
+_LLM_DEPLOYMENT_ID = config.llm_deployment_id
+_LLM_DEFAULT_MODEL = config.llm_default_model
+_USE_LLM_GATEWAY = config.use_datarobot_llm_gateway
+
+# トークン数の概算に使用するエンコーダ。tiktoken が利用可能であれば
+# 実際のトークナイザを使い、なければ文字数ベースの概算にフォールバックする
+_TOKEN_ENCODING: "Encoding | None"
+try:
+    import tiktoken
+
+    _TOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # pragma: no cover - tiktoken 不在/エンコーディング取得失敗
+    # get_encoding は初回に BPE ファイルを取得するため、オフライン環境では
+    # ネットワークエラーになり得る。その場合も概算へフォールバックする
+    _TOKEN_ENCODING = None
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """テキストのトークン数をカウント（結果を LRU キャッシュ）
+
+    同一メッセージは会話が続く限り毎ターン再評価されるため、
+    カウント結果を内容をキーにキャッシュします。
+
+    Args:
+        text: カウント対象のテキスト
+
+    Returns:
+        int: トークン数（tiktoken がなければ文字数ベースの概算）
+    """
+    if _TOKEN_ENCODING is not None:
+        return len(_TOKEN_ENCODING.encode(text))
+    # フォールバック: 1文字あたり約0.5トークン（日本語混在を想定した概算）
+    return (len(text) >> 1) + 1
+
+
+# OpenAI 形式の role から LangChain メッセージクラスへのマッピング
+_ROLE_TO_MESSAGE = {
+    "system": SystemMessage,
+    "assistant": AIMessage,
+    "user": HumanMessage,
+}
+
+# 静的なシステムプロンプトはインポート時に一度だけレンダリングし、
+# メッセージオブジェクトごと再利用する。~6KB のテンプレート整形と
+# SystemMessage の再構築をエージェント呼び出しごとに行わないため。
+# cache_control 付きの安定したメッセージブロックはプロバイダ側の
+# プロンプトキャッシュとも噛み合う
+_STATIC_SYSTEM_PROMPT = make_system_prompt(DATAROBOT_EXPERT_PROMPT)
+_STATIC_SYSTEM_MESSAGE = SystemMessage(
+    content=_STATIC_SYSTEM_PROMPT,
+    additional_kwargs={"cache_control": {"type": "ephemeral"}},
+)
+
+
+@lru_cache(maxsize=2)
+def _datetime_message(epoch_second: int) -> SystemMessage:
+    """現在日時のシステムメッセージを秒単位でキャッシュして構築
+
+    日本語リテラルを含む strftime は意外と高コストなため、
+    同一秒内の呼び出し（1ユーザーターン内の複数アクセス）では
+    strftime・テンプレート整形・メッセージ構築を再実行しません。
+    maxsize=2 は秒境界をまたいだ直後の取りこぼしを防ぐため。
+
+    Args:
+        epoch_second: 秒に切り捨てた現在時刻（キャッシュキー）
+
+    Returns:
+        SystemMessage: レンダリング済みの現在日時メッセージ
+    """
+    current_datetime = datetime.fromtimestamp(epoch_second).strftime(
+        "%Y年%m月%d日 %H:%M:%S"
+    )
+    return SystemMessage(
+        content=CURRENT_DATETIME_PROMPT.format(current_datetime=current_datetime)
+    )
+
+
+# クエリ内容に応じたモデルルーティング。単純な問い合わせは高速・低コストな
+# デフォルトモデルで十分であり、DSレビューのような重い依頼のみ
+# 高性能モデルに回す
+_HEAVY_MODEL = "datarobot/vertex_ai/gemini-3-pro-preview"
+# 重いモデルを選択するキーワード（DSレビュー・分析系の依頼）
+_HEAVY_KEYWORDS = ("分析", "レビュー", "評価", "比較", "リーケージ")
+# このクエリ長を超える依頼は複合的とみなし重いモデルに回す
+_MODEL_ROUTE_MAX_SIMPLE_CHARS = 80
+
+# 定型クエリから参照系ツールへの対応表。ここにマッチする単純な問い合わせは
+# ReAct ループ（LLM 往復）を経由せず、ツールを直接呼び出して応答する
+_FAST_PATH_TOOLS = {
+    "プロジェクト一覧": "list_projects",
+    "デプロイメント一覧": "list_deployments",
+}
+# ファストパスを適用する最大クエリ長。長い指示は文脈依存の可能性が
+# 高いため、通常の ReAct ループに回す
+_FAST_PATH_MAX_QUERY_CHARS = 40
+# ファストパスを適用する表示系の語尾。キーワードを含むだけの操作依頼
+# （「プロジェクト一覧から古いものを削除して」など）を誤って一覧の
+# 生ダンプで応答しないよう、表示意図が明示されたクエリに限定する
+_FAST_PATH_INTENT_SUFFIXES = ("見せて", "表示", "表示して", "教えて")
+
+# 同一会話内で繰り返し呼ばれても結果が変わらない参照系ツール。
+# これらはツール結果キャッシュの対象となる
+READ_ONLY_TOOLS = frozenset(
+    {
+        "list_projects",
+        "list_deployments",
+        "get_all_available_tags",
+        "get_tool_info_by_name",
+        "list_ai_catalog_items",
+        "get_model_feature_impact",
+    }
+)
+
+
+def _ensure_shared_llm_session(timeout: float | None) -> None:
+    """LiteLLM にプロセス共有の HTTP セッションを設定
+
+    呼び出しごとに新しいセッションが作られると HTTP keep-alive が
+    効かず、LLM ラウンドごとに TCP+TLS の再ネゴシエーションが発生します。
+    接続プール付きの AsyncClient を一度だけ作成して共有します。
+    """
+    import httpx
+    import litellm
+
+    if litellm.aclient_session is None:
+        litellm.aclient_session = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=timeout,
+        )
+
+
+def _agent_node_cache_key(state: MessagesState) -> str:
+    """エージェントノードのキャッシュキーを状態から生成
+
+    直近3メッセージの内容で同一状態を判定します。リトライや
+    セッション再開で同じ状態が再実行された際に LLM 呼び出しを
+    スキップするために使用します。
+
+    Args:
+        state: 現在の会話状態
+
+    Returns:
+        str: 状態を表すハッシュ
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for message in state["messages"][-3:]:
+        digest.update(str(message.content).encode())
+    return digest.hexdigest()
+
 
-config = Config()
+def _tool_cache_key(tool_name: str, args: Mapping[str, Any]) -> str:
+    """ツール名と引数から決定的なキャッシュキーを生成"""
+    payload = orjson.dumps(
+        dict(args), option=orjson.OPT_SORT_KEYS, default=str
+    )
+    return hashlib.blake2b(
+        tool_name.encode() + b":" + payload, digest_size=16
+    ).hexdigest()
+
+
+class _ToolResultCache:
+    """参照系 MCP ツール結果の TTL キャッシュ
+
+    (ツール名, 引数) をキーに直近の結果を保持し、
+    同一会話内での重複呼び出しをネットワーク往復なしで返します。
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if monotonic() > expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if len(self._entries) >= self._maxsize:
+            now = monotonic()
+            for expired_key in [
+                k for k, (expires_at, _) in self._entries.items() if expires_at < now
+            ]:
+                del self._entries[expired_key]
+            # 期限切れ削除後も上限を超える場合は最古のエントリを捨てる
+            while len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (monotonic() + self._ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 class MyAgent(LangGraphAgent):
@@ -72,6 +300,57 @@ class MyAgent(LangGraphAgent):
     MAX_CONTEXT_TOKENS = 500000
     # 1文字あたりの平均トークン数（日本語は約1.5-2トークン/文字）
     CHARS_PER_TOKEN = 0.5
+    # max_tokens から最大文字数への変換を事前計算（1 / CHARS_PER_TOKEN 倍）
+    # convert_input_message 内のホットループで float 除算を繰り返さないため
+    MAX_CHARS_BY_TOKENS = {1500: 3000, 2000: 4000, 3000: 6000}
+
+    def __init__(
+        self, *args: Any, use_tool_cache: bool = True, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # LLM インスタンスのキャッシュ（(preferred_model, auto_model_override) をキー）
+        self._llm_cache: dict[tuple[str | None, bool], ChatLiteLLM] = {}
+        # モデル別 ReAct エージェントのキャッシュ（preferred_model をキー）
+        self._agent_cache: dict[str | None, Any] = {}
+        # 参照系ツール結果のキャッシュ（READ_ONLY_TOOLS のみ対象）
+        self._use_tool_cache = use_tool_cache
+        self._tool_cache = _ToolResultCache()
+
+    def clear_tool_cache(self) -> None:
+        """参照系ツール結果のキャッシュをクリア"""
+        self._tool_cache.clear()
+
+    def _wrap_cached_tool(self, tool: BaseTool) -> BaseTool:
+        """参照系ツールを TTL キャッシュ付きのラッパーで包む"""
+
+        async def cached_ainvoke(**tool_args: Any) -> Any:
+            key = _tool_cache_key(tool.name, tool_args)
+            hit = self._tool_cache.get(key)
+            if hit is not None:
+                if self.verbose:
+                    print(f"[MyAgent] Tool cache hit: {tool.name}")
+                return hit
+            result = await tool.ainvoke(tool_args)
+            self._tool_cache.set(key, result)
+            return result
+
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            coroutine=cached_ainvoke,
+        )
+
+    def _with_tool_cache(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """参照系ツールのみキャッシュ付きラッパーに差し替えたリストを返す"""
+        if not self._use_tool_cache:
+            return tools
+        return [
+            self._wrap_cached_tool(tool)
+            if getattr(tool, "name", None) in READ_ONLY_TOOLS
+            else tool
+            for tool in tools
+        ]
 
     def _estimate_tokens(self, text: str) -> int:
         """テキストのトークン数を概算
@@ -82,7 +361,7 @@ class MyAgent(LangGraphAgent):
         Returns:
             int: 推定トークン数
         """
-        return int(len(text) * self.CHARS_PER_TOKEN) + 1
+        return _count_tokens(text)
 
     def _truncate_message_content(self, content: str, max_tokens: int = 2000) -> str:
         """メッセージの内容を切り詰める
@@ -96,23 +375,35 @@ class MyAgent(LangGraphAgent):
         Returns:
             str: 切り詰められたコンテンツ
         """
-        estimated_tokens = self._estimate_tokens(content)
-        if estimated_tokens <= max_tokens:
+        max_chars = self.MAX_CHARS_BY_TOKENS.get(max_tokens) or int(
+            max_tokens / self.CHARS_PER_TOKEN
+        )
+
+        # トークン推定より先に文字数で短絡（切り詰め不要なケースが大半）
+        if len(content) <= max_chars:
             return content
 
-        # 最大文字数を計算
-        max_chars = int(max_tokens / self.CHARS_PER_TOKEN)
-        
         # JSON形式のデータを検出して切り詰め
-        if content.strip().startswith("{") or content.strip().startswith("["):
+        # 数KB のコンテンツを丸ごと lstrip() してコピーを作らず、
+        # 先頭の数文字だけ見て判定する
+        if content[:16].lstrip()[:1] in ("{", "["):
             truncated = content[:max_chars]
+            # 途中で切れた JSON は LLM コンテキストを汚すため、
+            # 最後に完結した要素境界（} または ]）まで戻って切る。
+            # ただし "[tool:name] {...}" のように先頭付近にしか境界が
+            # 無い場合（長い文字列値が大半を占めるペイロード）に
+            # そこまで巻き戻すと観測結果がほぼ丸ごと消えてしまうため、
+            # 境界が後半にある場合だけ巻き戻す
+            boundary = max(truncated.rfind("}"), truncated.rfind("]"))
+            if boundary > max_chars // 2:
+                truncated = truncated[: boundary + 1]
             return truncated + "\n... [データが長すぎるため省略されました]"
-        
+
         # 通常のテキストの場合、最後を切り詰め
         return content[:max_chars] + "\n... [続きは省略されました]"
 
     def convert_input_message(
-        self, completion_create_params: CompletionCreateParams | Mapping[str, Any]
+        self, completion_create_params: "CompletionCreateParams | Mapping[str, Any]"
     ) -> Command:
         """会話履歴を MessagesState に変換（トークン制限付き）
 
@@ -129,44 +420,66 @@ class MyAgent(LangGraphAgent):
         messages_raw = params.get("messages", [])
         
         # OpenAI 形式のメッセージを LangChain 形式に変換
-        langchain_messages = []
+        # list.insert(0, ...) は O(N) のシフトコストがかかるため、
+        # deque.appendleft で O(1) に先頭へ追加する
+        converted: deque[Any] = deque()
         total_tokens = 0
-        
+        # 既出のツール結果のハッシュ（逆順走査なので先に見たものが最新）
+        seen_tool_hashes: set[bytes] = set()
+
         # 最新のメッセージから逆順で処理し、トークン制限内に収める
         for msg in reversed(messages_raw):
             role = msg.get("role", "user")
             content = msg.get("content", "")
-            
+
             # ツール結果（[tool:xxx] で始まる）は短く切り詰める
             if role == "assistant" and content.startswith("[tool:"):
-                content = self._truncate_message_content(content, max_tokens=1500)
+                # 同一ツール結果の重複は最新の1件だけを残し、
+                # 古い方はプレースホルダに置き換えてプレフィルを節約する
+                content_hash = hashlib.blake2b(
+                    content[:256].encode(), digest_size=8
+                ).digest()
+                if content_hash in seen_tool_hashes:
+                    content = "[tool: 結果は変化なし。後続の同一結果を参照]"
+                else:
+                    seen_tool_hashes.add(content_hash)
+                    content = self._truncate_message_content(content, max_tokens=1500)
             # 長いアシスタントメッセージも切り詰める
             elif role == "assistant" and self._estimate_tokens(content) > 3000:
                 content = self._truncate_message_content(content, max_tokens=3000)
-            
+
             msg_tokens = self._estimate_tokens(content)
-            
+
             # トークン制限を超える場合は古いメッセージを除外
             if total_tokens + msg_tokens > self.MAX_CONTEXT_TOKENS:
                 if self.verbose:
                     print(f"[MyAgent] Token limit reached. Skipping older messages.")
                 break
-            
+
             total_tokens += msg_tokens
-            
-            if role == "system":
-                langchain_messages.insert(0, SystemMessage(content=content))
-            elif role == "assistant":
-                langchain_messages.insert(0, AIMessage(content=content))
-            else:  # user
-                langchain_messages.insert(0, HumanMessage(content=content))
-        
-        if self.verbose:
-            print(f"[MyAgent.convert_input_message] Converting {len(langchain_messages)}/{len(messages_raw)} messages (~{total_tokens} tokens)")
+
+            message_cls = _ROLE_TO_MESSAGE.get(role, HumanMessage)
+            converted.appendleft(message_cls(content=content))
+
+        langchain_messages = list(converted)
+
+        # プレビュー整形はデバッグログが有効なときだけ行う。
+        # print はイベントループをブロックし得るため logger.debug に委ねる
+        if self.verbose and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[MyAgent.convert_input_message] Converting %d/%d messages (~%d tokens)",
+                len(langchain_messages),
+                len(messages_raw),
+                total_tokens,
+            )
             for i, msg in enumerate(langchain_messages[-5:]):  # 最後の5件のみ表示
-                content_preview = msg.content[:80] + "..." if len(msg.content) > 80 else msg.content
-                print(f"  [{i}] {type(msg).__name__}: {content_preview}")
-        
+                logger.debug(
+                    "  [%d] %s: %s",
+                    i,
+                    type(msg).__name__,
+                    textwrap.shorten(str(msg.content), width=80, placeholder="..."),
+                )
+
         command = Command(
             update={
                 "messages": langchain_messages,
@@ -174,12 +487,129 @@ class MyAgent(LangGraphAgent):
         )
         return command
 
-    @property
+    async def run_batch_async(
+        self,
+        inputs: "list[CompletionCreateParams | Mapping[str, Any]]",
+        max_concurrency: int = 10,
+    ) -> list[Any]:
+        """複数の補完リクエストを並行実行
+
+        データセット規模の評価や複数ユーザーのファンインなど、
+        独立したリクエスト群をまとめて処理するためのバッチ実行フック。
+        ワークフローは一度だけコンパイルし、セマフォで同時実行数を
+        制限しながら asyncio.gather で並行実行します。
+
+        Args:
+            inputs: OpenAI 形式のリクエストパラメータのリスト
+            max_concurrency: 同時に実行するリクエスト数の上限
+
+        Returns:
+            list[Any]: 各リクエストの最終状態（入力順を保持）
+        """
+        compiled_workflow = self.workflow.compile()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(
+            params: "CompletionCreateParams | Mapping[str, Any]",
+        ) -> Any:
+            async with semaphore:
+                return await compiled_workflow.ainvoke(
+                    self.convert_input_message(params),
+                    config=cast("RunnableConfig", self.langgraph_config),
+                )
+
+        return list(await asyncio.gather(*(run_one(params) for params in inputs)))
+
+    def _match_fast_path_tool(self, state: MessagesState) -> BaseTool | None:
+        """定型クエリに 1:1 対応する参照系ツールを検索
+
+        「プロジェクト一覧を見せて」のような単純な問い合わせは
+        LLM を介さずツール結果をそのまま返せるため、対応表に
+        マッチするツールを返します。マッチしない場合は None。
+
+        Args:
+            state: 現在の会話状態
+
+        Returns:
+            BaseTool | None: ファストパスで実行するツール
+        """
+        messages = state.get("messages") or []
+        if not messages:
+            return None
+        last_message = messages[-1]
+        if not isinstance(last_message, HumanMessage):
+            return None
+        query = str(last_message.content)
+        if len(query) > _FAST_PATH_MAX_QUERY_CHARS:
+            return None
+
+        # キーワード一致だけでは操作依頼まで拾ってしまうため、
+        # キーワードそのもの、または表示系の語尾で終わるクエリに限定する
+        stripped = query.rstrip("。！？!?")
+        # ベースクラス側の mcp_tools は型付けされていないため、ここで
+        # BaseTool のリストとして固定して Any の戻り値を避ける
+        mcp_tools: list[BaseTool] = self.mcp_tools
+        for keyword, tool_name in _FAST_PATH_TOOLS.items():
+            if keyword not in stripped:
+                continue
+            if stripped != keyword and not stripped.endswith(
+                _FAST_PATH_INTENT_SUFFIXES
+            ):
+                continue
+            for tool in mcp_tools:
+                if tool.name == tool_name:
+                    return tool
+        return None
+
+    async def _agent_node(self, state: MessagesState) -> Any:
+        """エージェントノード本体（ファストパス付き）
+
+        定型クエリは参照系ツールを直接呼び出して LLM の要約往復を
+        スキップし、それ以外は通常の ReAct エージェントに委譲します。
+
+        Args:
+            state: 現在の会話状態
+
+        Returns:
+            Any: メッセージ更新を含む状態
+        """
+        fast_path_tool = self._match_fast_path_tool(state)
+        if fast_path_tool is not None:
+            if self.verbose:
+                print(f"[MyAgent] Fast path: {fast_path_tool.name}")
+            try:
+                result = await fast_path_tool.ainvoke({})
+            except Exception:
+                # ツール呼び出しの失敗でターン全体を落とさず、通常の
+                # ReAct ループに戻してエラーを LLM に処理させる
+                logger.exception(
+                    "Fast path tool %s failed; falling back to the agent",
+                    fast_path_tool.name,
+                )
+            else:
+                return {"messages": [AIMessage(content=str(result))]}
+
+        # クエリの複雑さに応じてモデルを選択（エージェントはモデル別に
+        # キャッシュされるため、ルーティングしても再構築コストはかからない）
+        messages = state.get("messages") or []
+        last_message = messages[-1] if messages else None
+        query = (
+            str(last_message.content)
+            if isinstance(last_message, HumanMessage)
+            else ""
+        )
+        preferred_model = self._route_model(query) if query else _HEAVY_MODEL
+        react_agent = self._build_agent(preferred_model)
+        return await react_agent.ainvoke(state)
+
+    @cached_property
     def workflow(self) -> StateGraph[MessagesState]:
         """ReAct パターンのワークフローを定義
 
         シンプルな単一ノード構成で、create_react_agent が
         ツール選択と実行を自動的に処理します。
+        構築コストを避けるため、初回アクセス時に構築した
+        ワークフローをインスタンスにキャッシュします。
 
         Returns:
             StateGraph[MessagesState]: コンパイル可能なワークフロー
@@ -188,12 +618,29 @@ class MyAgent(LangGraphAgent):
             MessagesState, None, MessagesState, MessagesState
         ](MessagesState)
 
-        # 単一ノードの ReAct エージェント
-        langgraph_workflow.add_node("agent", self.agent)
+        # 単一ノードの ReAct エージェント（定型クエリはファストパスで処理）。
+        # CachePolicy により、同一状態での再実行（リトライ・セッション再開）
+        # では 5 分間ノード出力を再利用して LLM 呼び出しをスキップする
+        langgraph_workflow.add_node(
+            "agent",
+            self._agent_node,
+            cache_policy=CachePolicy(ttl=300, key_func=_agent_node_cache_key),
+        )
         langgraph_workflow.add_edge(START, "agent")
         langgraph_workflow.add_edge("agent", END)
 
-        return langgraph_workflow  # type: ignore[return-value]
+        # LangGraphAgent 側は workflow.compile() を引数なしで呼ぶため、
+        # ノードキャッシュのバックエンドをここで束縛しておく
+        original_compile = langgraph_workflow.compile
+        node_cache: InMemoryCache[Any] = InMemoryCache()
+
+        def compile_with_cache(**kwargs: Any) -> Any:
+            kwargs.setdefault("cache", node_cache)
+            return original_compile(**kwargs)
+
+        langgraph_workflow.compile = compile_with_cache  # type: ignore[assignment, method-assign]
+
+        return langgraph_workflow
 
     @property
     def prompt_template(self) -> ChatPromptTemplate:
@@ -215,7 +662,7 @@ class MyAgent(LangGraphAgent):
         self,
         preferred_model: str | None = None,
         auto_model_override: bool = True,
-    ) -> ChatLiteLLM:
+    ) -> "ChatLiteLLM":
         """LLM インスタンスを取得
 
         DataRobot の認証情報と設定を使用して LLM を初期化します。
@@ -229,43 +676,118 @@ class MyAgent(LangGraphAgent):
         Returns:
             ChatLiteLLM: 設定済みの LLM インスタンス
         """
-        api_base = self.litellm_api_base(config.llm_deployment_id)
+        from langchain_litellm.chat_models import ChatLiteLLM
+
+        cache_key = (preferred_model, auto_model_override)
+        cached = self._llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        _ensure_shared_llm_session(self.timeout)
+        api_base = self.litellm_api_base(_LLM_DEPLOYMENT_ID)
         model = preferred_model
 
         if preferred_model is None:
-            model = config.llm_default_model
-        if auto_model_override and not config.use_datarobot_llm_gateway:
-            model = config.llm_default_model
+            model = _LLM_DEFAULT_MODEL
+        if auto_model_override and not _USE_LLM_GATEWAY:
+            model = _LLM_DEFAULT_MODEL
 
         if self.verbose:
             print(f"Using model: {model}")
 
-        return ChatLiteLLM(
+        llm = ChatLiteLLM(
             model=model,
             api_base=api_base,
             api_key=self.api_key,
             timeout=self.timeout,
+            # トークン単位のストリーミングを常に有効化する。
+            # LangGraphAgent 側は stream_mode=["updates", "messages"] で
+            # グラフ境界までチャンクを転送するため、ここで無効化しない限り
+            # time-to-first-token はエージェント全体の完了を待たない
             streaming=True,
+            disable_streaming=False,
             max_retries=3,
+            # OpenAI 互換プロバイダ向け: 静的なシステムプロンプト+ツール定義の
+            # プレフィルを再利用させる（Anthropic 系は cache_control 側で対応）。
+            # parallel_tool_calls で独立したツール呼び出しを1ターンにまとめられる
+            # ようにする（ToolNode 側は複数呼び出しを並行実行する）
+            model_kwargs={
+                "parallel_tool_calls": True,
+                "extra_body": {"prompt_cache_key": "datarobot-expert-v1"},
+            },
         )
+        self._llm_cache[cache_key] = llm
+        return llm
 
-    @property
-    def agent(self) -> Any:
-        """ReAct エージェントを構築
+    def _agent_prompt(self, state: MessagesState) -> list[Any]:
+        """ReAct エージェント用のプロンプトを構築
+
+        現在日時は呼び出し時に評価するため、キャッシュ済みの
+        エージェントをリクエストをまたいで再利用できます。
+
+        Args:
+            state: 現在の会話状態
+
+        Returns:
+            list[Any]: システムプロンプトを先頭に付加したメッセージリスト
+        """
+        # 静的なプロンプト本体には cache_control が付与済みで、プロバイダ側の
+        # プロンプトキャッシュ（Anthropic/OpenAI/Vertex）を有効化する。
+        # 時刻のように毎回変わる部分はキャッシュ対象の後ろに別メッセージで付加する。
+        datetime_prompt = _datetime_message(int(time()))
+        return [_STATIC_SYSTEM_MESSAGE, datetime_prompt, *state["messages"]]
+
+    def _route_model(self, last_user_msg: str) -> str | None:
+        """クエリ内容に応じて使用モデルを選択
+
+        短く単純な問い合わせは高速なデフォルトモデルに、
+        DSレビュー・分析系の依頼や長い指示は高性能モデルにルーティング
+        します。
+
+        Args:
+            last_user_msg: 直近のユーザーメッセージ
+
+        Returns:
+            str | None: 使用するモデル名（None はデフォルトモデル）
+        """
+        if len(last_user_msg) > _MODEL_ROUTE_MAX_SIMPLE_CHARS:
+            return _HEAVY_MODEL
+        if any(keyword in last_user_msg for keyword in _HEAVY_KEYWORDS):
+            return _HEAVY_MODEL
+        return None
+
+    def _build_agent(self, preferred_model: str | None) -> Any:
+        """指定モデルの ReAct エージェントを構築（モデル別にキャッシュ）
 
         create_react_agent を使用して、MCP ツールを自動的に
         選択・実行できるエージェントを作成します。
 
+        Args:
+            preferred_model: 使用するモデル名（None はデフォルトモデル）
+
         Returns:
             Any: ReAct エージェントインスタンス
         """
-        current_datetime = datetime.now().strftime("%Y年%m月%d日 %H:%M:%S")
-
-        return create_react_agent(
-            self.llm(preferred_model="datarobot/vertex_ai/gemini-3-pro-preview"),
-            tools=self.mcp_tools,
-            prompt=make_system_prompt(
-                DATAROBOT_EXPERT_PROMPT.format(current_datetime=current_datetime)
-            ),
+        cached = self._agent_cache.get(preferred_model)
+        if cached is not None:
+            return cached
+
+        from langgraph.prebuilt import create_react_agent
+
+        react_agent = create_react_agent(
+            self.llm(preferred_model=preferred_model),
+            tools=self._with_tool_cache(self.mcp_tools),
+            prompt=self._agent_prompt,
             name="DataRobot DS Model Review Assistant",
         )
+        self._agent_cache[preferred_model] = react_agent
+        return react_agent
+
+    @property
+    def agent(self) -> Any:
+        """高性能モデルを使用する ReAct エージェント
+
+        Returns:
+            Any: ReAct エージェントインスタンス
+        """
+        return self._build_agent(_HEAVY_MODEL)
@@ -271,6 +271,7 @@ User: LendingClubのモデル精度を見せて
 - ✅ ユーザーの質問に対して、まず適切なツールを呼び出す
 - ✅ ツールの結果をそのまま整形して表示する
 - ✅ 結果が大量の場合は上位N件を表示し「続きを見ますか？」と確認
+- ✅ 互いに依存しない参照系の呼び出し（例: プロジェクト一覧とデプロイ一覧）は、1ターンでまとめて並列にツール呼び出しする
 
 ## あなたの役割
 - ユーザーのDataRobot環境にある**実際のデータ**を取得・分析する
@@ -875,6 +876,8 @@ DataRobotには多様なモデルインサイト機能があります。ユー
 - 長いリストは上位10件 + 「他N件」で省略
 - 🚨 警告（リーケージ、異常値等）は目立つように表示
 - 🔍 DS観点のコメントは各セクションに追加
-
-現在の日時: {current_datetime}
 """
+
+# 現在日時はキャッシュ対象のプロンプト本体から分離し、呼び出し時に
+# 別メッセージとして付加する（プロンプトキャッシュを無効化しないため）
+CURRENT_DATETIME_PROMPT = """現在の日時: {current_datetime}"""
@@ -12,3 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
+import json
+
+from agent import MyAgent
+
+
+class TestTruncateMessageContent:
+    def _make_agent(self):
+        return MyAgent(api_key="test_key", api_base="test_base")
+
+    def test_json_array_rolls_back_to_element_boundary(self):
+        agent = self._make_agent()
+        content = json.dumps(
+            [{"name": f"project-{i}", "id": str(i) * 8} for i in range(200)]
+        )
+        truncated = agent._truncate_message_content(content, max_tokens=1500)
+
+        # Truncation inside an element would leave dangling JSON; the result
+        # should end at a complete object boundary before the marker.
+        body = truncated.rsplit("\n", 1)[0]
+        assert body.endswith("}")
+        assert len(body) <= 3000
+
+    def test_tool_observation_with_long_string_value_is_not_collapsed(self):
+        agent = self._make_agent()
+        # Shape produced by the frontend tool-result rendering: a [tool:name]
+        # prefix followed by JSON whose payload is one long string value. The
+        # only }/] within the truncation window is the ] of the prefix, so a
+        # naive boundary rollback would collapse the whole observation.
+        content = "[tool:get_model_feature_impact] " + json.dumps(
+            {"tool": "get_model_feature_impact", "result": "x" * 5000}
+        )
+        truncated = agent._truncate_message_content(content, max_tokens=1500)
+
+        body = truncated.rsplit("\n", 1)[0]
+        assert len(body) == 3000
+        assert '"result": "xxxx' in truncated
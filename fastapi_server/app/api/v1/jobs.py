@@ -22,17 +22,21 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from app.auth.ctx import must_get_auth_ctx
+from app.auth.ctx import get_user_uuid, must_get_auth_ctx
+from app.jobs.autopilot import AutoPilotMonitor
 from app.jobs.manager import JobInfo, JobStatus
 
 from datarobot.auth.session import AuthCtx
 from datarobot.auth.typing import Metadata
 
 logger = logging.getLogger(__name__)
-jobs_router = APIRouter(tags=["Jobs"])
+# orjson は UUID / datetime / str Enum をネイティブにシリアライズできるため、
+# ジョブ一覧のようなレスポンス中心のエンドポイントで標準 json.dumps より大幅に速い
+jobs_router = APIRouter(tags=["Jobs"], default_response_class=ORJSONResponse)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -52,7 +56,9 @@ class JobResponse(BaseModel):
 
     @classmethod
     def from_job_info(cls, job: JobInfo) -> "JobResponse":
-        return cls(
+        # JobInfo は内部で整合性が保たれているため、
+        # フィールドごとの pydantic バリデーションを省略する
+        return cls.model_construct(
             job_id=job.job_id,
             job_type=job.job_type,
             status=job.status,
@@ -79,11 +85,13 @@ class CreateAutoPilotMonitorResponse(BaseModel):
 # Endpoints
 # ─────────────────────────────────────────────────────────────
 
-@jobs_router.get("/jobs")
+# response_model は OpenAPI スキーマ宣言のみに使い、実際のレスポンスは
+# キャッシュ済み JSON bytes をそのまま返す（pydantic 層を通らない）
+@jobs_router.get("/jobs", response_model=list[JobResponse])
 async def list_jobs(
     request: Request,
-    auth_ctx: AuthCtx[Metadata] = Depends(must_get_auth_ctx),
-) -> list[JobResponse]:
+    user_id: UUID = Depends(get_user_uuid),
+) -> Response:
     """
     現在のユーザーのジョブ一覧を取得
 
@@ -91,19 +99,21 @@ async def list_jobs(
         list[JobResponse]: ジョブ情報のリスト
     """
     job_manager = request.app.state.deps.job_manager
-    user_id = UUID(auth_ctx.user.id)
 
     jobs = job_manager.get_jobs_by_user(user_id)
 
-    return [JobResponse.from_job_info(job) for job in jobs]
+    # JobInfo 側でキャッシュされた JSON bytes をそのまま連結して返す
+    # （FastAPI のシリアライズパスを完全にバイパス）
+    payload = b"[" + b",".join(job.to_json() for job in jobs) + b"]"
+    return Response(content=payload, media_type="application/json")
 
 
-@jobs_router.get("/jobs/{job_id}")
+@jobs_router.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job(
     request: Request,
     job_id: UUID,
-    auth_ctx: AuthCtx[Metadata] = Depends(must_get_auth_ctx),
-) -> JobResponse:
+    user_id: UUID = Depends(get_user_uuid),
+) -> Response:
     """
     特定のジョブ情報を取得
 
@@ -114,7 +124,6 @@ async def get_job(
         JobResponse: ジョブ情報
     """
     job_manager = request.app.state.deps.job_manager
-    user_id = UUID(auth_ctx.user.id)
 
     job = job_manager.get_job(job_id)
 
@@ -131,14 +140,14 @@ async def get_job(
             detail="Access denied",
         )
 
-    return JobResponse.from_job_info(job)
+    return Response(content=job.to_json(), media_type="application/json")
 
 
 @jobs_router.post("/jobs/{job_id}/cancel")
 async def cancel_job(
     request: Request,
     job_id: UUID,
-    auth_ctx: AuthCtx[Metadata] = Depends(must_get_auth_ctx),
+    user_id: UUID = Depends(get_user_uuid),
 ) -> JobResponse:
     """
     ジョブをキャンセル
@@ -150,7 +159,6 @@ async def cancel_job(
         JobResponse: 更新されたジョブ情報
     """
     job_manager = request.app.state.deps.job_manager
-    user_id = UUID(auth_ctx.user.id)
 
     job = job_manager.get_job(job_id)
 
@@ -196,6 +204,7 @@ async def create_autopilot_monitor(
     request: Request,
     body: CreateAutoPilotMonitorRequest,
     auth_ctx: AuthCtx[Metadata] = Depends(must_get_auth_ctx),
+    user_id: UUID = Depends(get_user_uuid),
 ) -> CreateAutoPilotMonitorResponse:
     """
     AutoPilot 進捗監視ジョブを作成
@@ -209,12 +218,9 @@ async def create_autopilot_monitor(
     Returns:
         CreateAutoPilotMonitorResponse: 作成されたジョブの情報
     """
-    from app.jobs.autopilot import AutoPilotMonitor
-
     deps = request.app.state.deps
     job_manager = deps.job_manager
     config = deps.config
-    user_id = UUID(auth_ctx.user.id)
 
     # API トークンを取得（auth_ctx から）
     api_token = auth_ctx.api_key if hasattr(auth_ctx, "api_key") else None
@@ -229,29 +235,27 @@ async def create_autopilot_monitor(
         )
 
     # 監視タスクを作成
+    # job_id は create_job 後に確定するためホルダー経由で渡す
+    # （タスクは create_job から戻った後に初めて実行される）
+    job_id_holder: dict[str, UUID] = {}
+
     async def monitor_task() -> dict:
-        monitor = AutoPilotMonitor(
-            api_token=api_token,
-            endpoint=config.datarobot_endpoint,
+        # 同一プロジェクトを監視する既存ジョブがあればポーリングを共有する
+        progress = await deps.autopilot_registry.watch(
+            project_id=body.project_id,
+            job_id=job_id_holder["job_id"],
+            job_manager=job_manager,
+            monitor_factory=lambda: AutoPilotMonitor(
+                api_token=api_token,
+                endpoint=config.datarobot_endpoint,
+                client=deps.http_client,
+            ),
         )
-        try:
-            # 注意: job_id は create_job 後に取得するため、
-            # ここでは簡易版の監視を実行
-            import asyncio
-
-            while True:
-                progress = await monitor.get_progress(body.project_id)
-
-                if progress.stage.value in ("completed", "failed"):
-                    return {
-                        "project_id": body.project_id,
-                        "status": progress.stage.value,
-                        "models_completed": progress.models_completed,
-                    }
-
-                await asyncio.sleep(10)
-        finally:
-            await monitor.close()
+        return {
+            "project_id": body.project_id,
+            "status": progress.stage.value,
+            "models_completed": progress.models_completed,
+        }
 
     job_id = await job_manager.create_job(
         job_type="autopilot_monitor",
@@ -259,6 +263,7 @@ async def create_autopilot_monitor(
         task=monitor_task(),
         metadata={"project_id": body.project_id},
     )
+    job_id_holder["job_id"] = job_id
 
     logger.info(f"Created AutoPilot monitor job: {job_id} for project: {body.project_id}")
 
@@ -268,11 +273,11 @@ async def create_autopilot_monitor(
     )
 
 
-@jobs_router.get("/jobs/active")
+@jobs_router.get("/jobs/active", response_model=list[JobResponse])
 async def list_active_jobs(
     request: Request,
-    auth_ctx: AuthCtx[Metadata] = Depends(must_get_auth_ctx),
-) -> list[JobResponse]:
+    user_id: UUID = Depends(get_user_uuid),
+) -> Response:
     """
     実行中のジョブ一覧を取得
 
@@ -280,10 +285,10 @@ async def list_active_jobs(
         list[JobResponse]: 実行中のジョブ情報リスト
     """
     job_manager = request.app.state.deps.job_manager
-    user_id = UUID(auth_ctx.user.id)
 
     # すべてのアクティブジョブを取得し、自分のジョブのみフィルタ
     all_active = job_manager.get_active_jobs()
     user_jobs = [job for job in all_active if job.user_id == user_id]
 
-    return [JobResponse.from_job_info(job) for job in user_jobs]
+    payload = b"[" + b",".join(job.to_json() for job in user_jobs) + b"]"
+    return Response(content=payload, media_type="application/json")
@@ -13,6 +13,7 @@
 # limitations under the License.
 import logging
 from typing import TYPE_CHECKING, Awaitable, Callable, Final
+from uuid import UUID
 
 from authlib.jose import jwt
 from datarobot.auth.oauth import OAuthToken, Profile
@@ -236,6 +237,23 @@ def must_get_auth_ctx(
     return auth_ctx
 
 
+def get_user_uuid(
+    request: Request,
+    auth_ctx: AuthCtx[Metadata] = Depends(must_get_auth_ctx),
+) -> UUID:
+    """
+    Returns the authenticated user's id parsed as a UUID.
+
+    UUID() re-validates its input string, so the parsed value is cached on
+    request.state and reused by every handler and dependency in the request.
+    """
+    user_uuid: UUID | None = getattr(request.state, "user_uuid", None)
+    if user_uuid is None:
+        user_uuid = UUID(auth_ctx.user.id)
+        request.state.user_uuid = user_uuid
+    return user_uuid
+
+
 def get_access_token(
     provider_id: ProviderType,
 ) -> Callable[[Request, AuthCtx[Metadata]], Awaitable[OAuthToken]]:
@@ -19,6 +19,7 @@ from typing import AsyncGenerator, Dict
 from urllib.parse import urlparse
 from uuid import UUID
 
+import httpx
 from datarobot.auth.oauth import AsyncOAuthComponent
 
 from app.ag_ui.stream_manager import AGUIStreamManager, create_stream_manager
@@ -27,6 +28,7 @@ from app.auth.oauth import get_oauth
 from app.chats import ChatRepository
 from app.config import Config
 from app.db import DBCtx, create_db_ctx
+from app.jobs.autopilot import AutoPilotMonitorRegistry
 from app.jobs.manager import JobManager
 from app.messages import MessageRepository
 from app.users.identity import IdentityRepository
@@ -40,9 +42,11 @@ logger = logging.getLogger(__name__)
 class Deps:
     api_key_validator: APIKeyValidator
     auth: AsyncOAuthComponent
+    autopilot_registry: AutoPilotMonitorRegistry
     chat_repo: ChatRepository
     config: Config
     db: DBCtx
+    http_client: httpx.AsyncClient
     identity_repo: IdentityRepository
     job_manager: JobManager
     message_repo: MessageRepository
@@ -115,6 +119,20 @@ async def create_deps(
     # バックグラウンドジョブマネージャー
     job_manager = JobManager()
 
+    # プロジェクト単位で AutoPilot 監視を共有するレジストリ
+    autopilot_registry = AutoPilotMonitorRegistry()
+
+    # プロセス全体で共有する HTTP クライアント
+    # （監視ジョブごとにクライアントを作らず、1 つの接続プールを使い回す）
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            keepalive_expiry=120,
+        ),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
     stream_manager = create_stream_manager(
         name="agent",
         chat_repo=chat_repo,
@@ -131,12 +149,15 @@ async def create_deps(
         api_key_validator=api_key_validator,
         auth=oauth,
         tokens=Tokens(oauth, identity_repo),
+        autopilot_registry=autopilot_registry,
         db=db,
+        http_client=http_client,
         job_manager=job_manager,
         stream_manager=stream_manager,
     )
 
     # shutdown routine
     await job_manager.shutdown()
+    await http_client.aclose()
     await oauth.close()
     await db.shutdown()
@@ -19,6 +19,7 @@ DataRobot AutoPilot の進捗を監視するバックグラウンドジョブ。
 """
 import asyncio
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -43,7 +44,25 @@ class AutoPilotStage(str, Enum):
     FAILED = "failed"                  # 失敗
 
 
-@dataclass
+def _progress_message(progress: "AutoPilotProgress") -> str:
+    """ジョブの状態メッセージを組み立てる"""
+    return (
+        f"{progress.stage.value}: "
+        f"{progress.models_completed}/{progress.total_models} models"
+    )
+
+
+# ステージ文字列 → AutoPilotStage の対応表（モジュールロード時に一度だけ構築）
+_STAGE_MAP = {
+    "eda": AutoPilotStage.EDA,
+    "modeling": AutoPilotStage.MODELING,
+    "fitting": AutoPilotStage.MODELING,
+    "feature": AutoPilotStage.FEATURE_ENGINEERING,
+    "complete": AutoPilotStage.COMPLETED,
+}
+
+
+@dataclass(slots=True)
 class AutoPilotProgress:
     """AutoPilot 進捗情報"""
     project_id: str
@@ -67,6 +86,7 @@ class AutoPilotMonitor:
         monitor = AutoPilotMonitor(
             api_token="your_token",
             endpoint="https://app.datarobot.com/api/v2",
+            client=deps.http_client,
         )
 
         progress = await monitor.get_progress(project_id)
@@ -77,29 +97,32 @@ class AutoPilotMonitor:
         self,
         api_token: str,
         endpoint: str,
+        client: httpx.AsyncClient,
         poll_interval: int = 10,  # 秒
     ) -> None:
         self.api_token = api_token
         self.endpoint = endpoint.rstrip("/")
         self.poll_interval = poll_interval
-        self._client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """HTTP クライアントを取得（遅延初期化）"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                headers={
-                    "Authorization": f"Bearer {self.api_token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
-        return self._client
-
-    async def close(self) -> None:
-        """クライアントをクローズ"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        # プロセス全体で共有されるクライアント（接続プールを全監視ジョブで再利用）。
+        # トークンはユーザーごとに異なるためリクエスト単位でヘッダーを付与する。
+        self._client = client
+        self._headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Content-Type": "application/json",
+        }
+        self._wakeup = asyncio.Event()
+        # project["created"] はプロジェクトの生涯で不変なので、
+        # ポーリングごとに ISO-8601 をパースし直さず文字列をキーに memoize する
+        self._created_at_cache: Dict[str, datetime] = {}
+        # プロジェクト本体から参照するのは targetedModelCount / created などの
+        # 静的フィールドのみなので、初回だけ取得してキャッシュする
+        self._project_cache: Dict[str, Dict[str, Any]] = {}
+        # モデル一覧の条件付き GET 用キャッシュ: (etag, 完了数, モデルタイプ)
+        self._models_cache: Dict[str, tuple[Optional[str], int, Optional[str]]] = {}
+
+    def poke(self) -> None:
+        """外部イベント（通知・他ジョブの完了など）で即座に再ポーリングさせる"""
+        self._wakeup.set()
 
     async def get_progress(self, project_id: str) -> AutoPilotProgress:
         """
@@ -111,26 +134,58 @@ class AutoPilotMonitor:
         Returns:
             AutoPilotProgress: 進捗情報
         """
-        client = await self._get_client()
-
         try:
-            # プロジェクト情報を取得
-            project_response = await client.get(
-                f"{self.endpoint}/projects/{project_id}/"
+            # プロジェクト本体（静的フィールド）は初回のみ取得
+            project = self._project_cache.get(project_id)
+            if project is None:
+                project_response = await self._client.get(
+                    f"{self.endpoint}/projects/{project_id}/",
+                    headers=self._headers,
+                )
+                project_response.raise_for_status()
+                project = project_response.json()
+                self._project_cache[project_id] = project
+
+            # 毎ポーリングでは軽量な status エンドポイントと、
+            # ETag による条件付き GET のモデル一覧だけを並列取得する
+            cached_etag, cached_count, cached_model_type = self._models_cache.get(
+                project_id, (None, 0, None)
             )
-            project_response.raise_for_status()
-            project = project_response.json()
-
-            # モデル一覧を取得
-            models_response = await client.get(
-                f"{self.endpoint}/projects/{project_id}/models/"
+            models_headers = self._headers
+            if cached_etag:
+                models_headers = {**self._headers, "If-None-Match": cached_etag}
+
+            status_response, models_response = await asyncio.gather(
+                self._client.get(
+                    f"{self.endpoint}/projects/{project_id}/status/",
+                    headers=self._headers,
+                ),
+                self._client.get(
+                    f"{self.endpoint}/projects/{project_id}/models/",
+                    headers=models_headers,
+                ),
             )
-            models_response.raise_for_status()
-            models = models_response.json()
+            status_response.raise_for_status()
+            project_status = status_response.json()
+
+            if models_response.status_code == httpx.codes.NOT_MODIFIED:
+                # 前回から変化なし: キャッシュ済みの値を再利用
+                models_completed = cached_count
+                current_model_type = cached_model_type
+            else:
+                models_response.raise_for_status()
+                models = models_response.json()
+                models_completed = len(models)
+                current_model_type = self._get_current_model_type(models)
+                self._models_cache[project_id] = (
+                    models_response.headers.get("ETag"),
+                    models_completed,
+                    current_model_type,
+                )
 
             # プロジェクトステータスをパース
-            stage = self._parse_stage(project.get("stage", ""))
-            autopilot_done = project.get("autopilotDone", False)
+            stage = self._parse_stage(project_status.get("stage", ""))
+            autopilot_done = project_status.get("autopilotDone", False)
 
             if autopilot_done:
                 stage = AutoPilotStage.COMPLETED
@@ -138,7 +193,6 @@ class AutoPilotMonitor:
             else:
                 # モデル数から進捗を推定
                 total_models = project.get("targetedModelCount", 0) or 20  # デフォルト値
-                models_completed = len(models)
                 progress_percent = min(
                     (models_completed / total_models) * 100, 99.0
                 )
@@ -147,9 +201,9 @@ class AutoPilotMonitor:
                 project_id=project_id,
                 stage=stage,
                 progress_percent=progress_percent,
-                models_completed=len(models),
+                models_completed=models_completed,
                 total_models=project.get("targetedModelCount", 0) or 20,
-                current_model_type=self._get_current_model_type(models),
+                current_model_type=current_model_type,
                 estimated_time_remaining=self._estimate_remaining_time(
                     progress_percent, project
                 ),
@@ -178,34 +232,27 @@ class AutoPilotMonitor:
 
     def _parse_stage(self, stage_str: str) -> AutoPilotStage:
         """プロジェクトステージ文字列をパース"""
-        stage_mapping = {
-            "eda": AutoPilotStage.EDA,
-            "modeling": AutoPilotStage.MODELING,
-            "fitting": AutoPilotStage.MODELING,
-            "feature": AutoPilotStage.FEATURE_ENGINEERING,
-            "complete": AutoPilotStage.COMPLETED,
-        }
+        stage = stage_str.lower()
 
-        for key, value in stage_mapping.items():
-            if key in stage_str.lower():
-                return value
+        # 大半の入力は既知の文字列そのものなので、まず完全一致で引く
+        exact = _STAGE_MAP.get(stage)
+        if exact is not None:
+            return exact
 
-        return AutoPilotStage.PREPARING
+        # 一致しない場合のみ部分文字列で探索
+        return next(
+            (value for key, value in _STAGE_MAP.items() if key in stage),
+            AutoPilotStage.PREPARING,
+        )
 
     def _get_current_model_type(self, models: list[Dict[str, Any]]) -> Optional[str]:
         """現在構築中のモデルタイプを取得"""
         if not models:
             return None
 
-        # 最新のモデルを取得
-        sorted_models = sorted(
-            models,
-            key=lambda m: m.get("createdAt", ""),
-            reverse=True,
-        )
-        if sorted_models:
-            return sorted_models[0].get("modelType", "Unknown")
-        return None
+        # 最新のモデルを取得（createdAt は ISO-8601 なので文字列比較で時系列順）
+        latest = max(models, key=lambda m: m.get("createdAt", ""))
+        return latest.get("modelType", "Unknown")
 
     def _estimate_remaining_time(
         self, progress: float, project: Dict[str, Any]
@@ -220,9 +267,12 @@ class AutoPilotMonitor:
             return None
 
         try:
-            created_at = datetime.fromisoformat(
-                created_at_str.replace("Z", "+00:00")
-            )
+            created_at = self._created_at_cache.get(created_at_str)
+            if created_at is None:
+                created_at = datetime.fromisoformat(
+                    created_at_str.replace("Z", "+00:00")
+                )
+                self._created_at_cache[created_at_str] = created_at
             elapsed = (datetime.now(created_at.tzinfo) - created_at).total_seconds()
 
             # 進捗率から残り時間を推定
@@ -239,7 +289,7 @@ class AutoPilotMonitor:
         self,
         project_id: str,
         job_manager: JobManager,
-        job_id: UUID,
+        job_id: Optional[UUID],
         on_progress: Optional[Callable[[AutoPilotProgress], Coroutine[Any, Any, None]]] = None,
     ) -> AutoPilotProgress:
         """
@@ -248,7 +298,7 @@ class AutoPilotMonitor:
         Args:
             project_id: DataRobot プロジェクト ID
             job_manager: ジョブマネージャー
-            job_id: 関連するジョブ ID
+            job_id: 関連するジョブ ID（None の場合は on_progress のみで通知）
             on_progress: 進捗更新時のコールバック
 
         Returns:
@@ -256,15 +306,23 @@ class AutoPilotMonitor:
         """
         logger.info(f"Starting AutoPilot monitoring for project: {project_id}")
 
+        # 状態変化がない間は待機時間を指数的に延ばし（1秒→最大60秒）、
+        # 変化を検知したら 1 秒に戻す。poke() による外部通知で即座に再開。
+        backoff = 1.0
+        max_backoff = 60.0
+        last_stage: Optional[AutoPilotStage] = None
+        last_models_completed: Optional[int] = None
+
         while True:
             progress = await self.get_progress(project_id)
 
             # ジョブマネージャーを更新
-            await job_manager.update_job(
-                job_id,
-                progress=progress.progress_percent / 100,
-                message=f"{progress.stage.value}: {progress.models_completed}/{progress.total_models} models",
-            )
+            if job_id is not None:
+                await job_manager.update_job(
+                    job_id,
+                    progress=progress.progress_percent / 100,
+                    message=_progress_message(progress),
+                )
 
             # コールバック呼び出し
             if on_progress:
@@ -277,13 +335,29 @@ class AutoPilotMonitor:
                 )
                 return progress
 
-            # 次のポーリングまで待機
-            await asyncio.sleep(self.poll_interval)
+            # 状態変化に応じて待機時間を調整
+            if (
+                progress.stage == last_stage
+                and progress.models_completed == last_models_completed
+            ):
+                backoff = min(backoff * 2, max_backoff)
+            else:
+                backoff = 1.0
+            last_stage = progress.stage
+            last_models_completed = progress.models_completed
+
+            # 次のポーリングまで待機（poke() で即時に起床可能）
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
 
 
 async def create_autopilot_monitor_task(
     api_token: str,
     endpoint: str,
+    client: httpx.AsyncClient,
     project_id: str,
     job_manager: JobManager,
     job_id: UUID,
@@ -300,16 +374,95 @@ async def create_autopilot_monitor_task(
             task=create_autopilot_monitor_task(
                 api_token=token,
                 endpoint=endpoint,
+                client=deps.http_client,
                 project_id=project_id,
                 job_manager=job_manager,
                 job_id=job_id,  # 事前に生成
             ),
         )
     """
-    monitor = AutoPilotMonitor(api_token, endpoint)
-    try:
-        return await monitor.monitor_until_complete(
-            project_id, job_manager, job_id, on_progress
-        )
-    finally:
-        await monitor.close()
+    monitor = AutoPilotMonitor(api_token, endpoint, client)
+    return await monitor.monitor_until_complete(
+        project_id, job_manager, job_id, on_progress
+    )
+
+
+class AutoPilotMonitorRegistry:
+    """
+    プロジェクト単位で AutoPilotMonitor を共有するレジストリ
+
+    同じプロジェクトを複数のジョブが監視しても、DataRobot への
+    ポーリングはプロジェクトごとに 1 本だけ走らせ、進捗を購読中の
+    全ジョブにファンアウトする。外部への GET 数はジョブ数ではなく
+    ユニークなプロジェクト数に比例する。
+    """
+
+    def __init__(self) -> None:
+        self._monitors: Dict[str, AutoPilotMonitor] = {}
+        self._tasks: Dict[str, asyncio.Task[AutoPilotProgress]] = {}
+        self._subscribers: Dict[str, set[UUID]] = defaultdict(set)
+
+    async def watch(
+        self,
+        project_id: str,
+        job_id: UUID,
+        job_manager: JobManager,
+        monitor_factory: Callable[[], AutoPilotMonitor],
+    ) -> AutoPilotProgress:
+        """
+        プロジェクトの監視に参加し、完了まで待機
+
+        既に同じプロジェクトの監視が走っていれば相乗りし、
+        なければ monitor_factory で新しい監視を開始する。
+
+        Returns:
+            AutoPilotProgress: 最終的な進捗情報
+        """
+        self._subscribers[project_id].add(job_id)
+
+        task = self._tasks.get(project_id)
+        if task is None or task.done():
+            monitor = monitor_factory()
+            self._monitors[project_id] = monitor
+            task = asyncio.create_task(
+                self._run(project_id, monitor, job_manager)
+            )
+            self._tasks[project_id] = task
+        else:
+            # 既存の監視に相乗り: 最新の進捗を即座に反映させる
+            self._monitors[project_id].poke()
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            subscribers = self._subscribers.get(project_id)
+            if subscribers is not None:
+                subscribers.discard(job_id)
+                # 最後の購読者がいなくなったら実際のポーリングも止める
+                if not subscribers and not task.done():
+                    task.cancel()
+            raise
+
+    async def _run(
+        self,
+        project_id: str,
+        monitor: AutoPilotMonitor,
+        job_manager: JobManager,
+    ) -> AutoPilotProgress:
+        async def fan_out(progress: AutoPilotProgress) -> None:
+            for sub_job_id in list(self._subscribers.get(project_id, ())):
+                await job_manager.update_job(
+                    sub_job_id,
+                    progress=progress.progress_percent / 100,
+                    message=_progress_message(progress),
+                )
+
+        try:
+            # ジョブ更新はファンアウト側で行うため job_id は渡さない
+            return await monitor.monitor_until_complete(
+                project_id, job_manager, None, on_progress=fan_out
+            )
+        finally:
+            self._tasks.pop(project_id, None)
+            self._monitors.pop(project_id, None)
+            self._subscribers.pop(project_id, None)
@@ -19,12 +19,15 @@ Job Manager
 """
 import asyncio
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Callable, Coroutine, Dict, Optional
 from uuid import UUID, uuid4
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +40,7 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"   # キャンセル済み
 
 
-@dataclass
+@dataclass(slots=True)
 class JobInfo:
     """ジョブ情報"""
     job_id: UUID
@@ -51,6 +54,31 @@ class JobInfo:
     result: Optional[Any] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # API レスポンス用の JSON bytes キャッシュ（update_job で無効化される）
+    _cached_json: Optional[bytes] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def to_json(self) -> bytes:
+        """API レスポンス形式の JSON bytes を返す（次の更新まで memoize）
+
+        ジョブは update_job でしか変化しないため、GET のたびに
+        pydantic シリアライズを走らせる必要はない。
+        """
+        if self._cached_json is None:
+            self._cached_json = orjson.dumps(
+                {
+                    "job_id": self.job_id,
+                    "job_type": self.job_type,
+                    "status": self.status,
+                    "progress": self.progress,
+                    "message": self.message,
+                    "created_at": self.created_at,
+                    "updated_at": self.updated_at,
+                    "error": self.error,
+                }
+            )
+        return self._cached_json
 
 
 # コールバック型定義
@@ -80,10 +108,73 @@ class JobManager:
     """
 
     def __init__(self) -> None:
-        self._jobs: Dict[UUID, JobInfo] = {}
-        self._tasks: Dict[UUID, asyncio.Task[Any]] = {}
-        self._callbacks: Dict[UUID, list[JobCallback]] = {}
+        # 内部構造のキーは UUID.int（128bit 整数）。UUID.__hash__ は
+        # 結局 int をハッシュするが Python メソッド呼び出しを挟むため、
+        # 生の int キーのほうが dict/set の各プローブが速い。
+        # 公開 API の入出力は従来どおり UUID のまま
+        self._jobs: Dict[int, JobInfo] = {}
+        self._tasks: Dict[int, asyncio.Task[Any]] = {}
+        self._callbacks: Dict[int, list[JobCallback]] = {}
         self._lock = asyncio.Lock()
+        # 二次インデックス（get_jobs_by_user / get_active_jobs を
+        # 全ジョブ走査ではなく出力サイズ比例にするため）
+        self._by_user: Dict[UUID, set[int]] = defaultdict(set)
+        self._active: set[int] = set()
+        # 現在時刻キャッシュ（1 秒粒度）。進捗更新のたびに datetime.utcnow() を
+        # 呼ぶコストを避ける。タイムスタンプに 1 秒以上の精度は不要
+        self._now_cache: datetime = datetime.utcnow()
+        self._ticker: Optional[asyncio.Task[None]] = None
+        # コールバックは update_job をブロックしないよう専用ワーカーで実行する
+        self._cb_queue: asyncio.Queue[tuple[list[JobCallback], JobInfo]] = (
+            asyncio.Queue()
+        )
+        self._cb_worker: Optional[asyncio.Task[None]] = None
+        # 終了時刻順のキュー。クリーンアップは左端から期限切れ分だけ
+        # 取り出せばよく、全ジョブ走査が不要になる
+        self._completed_order: deque[tuple[datetime, int]] = deque()
+        self._cleanup_task: Optional[asyncio.Task[None]] = None
+        # ステータス遷移をブロードキャストする Condition。
+        # 呼び出し側は sleep でポーリングせずに wait_for_status で待てる
+        self._cond = asyncio.Condition()
+
+    async def _tick(self) -> None:
+        """現在時刻キャッシュを 1 秒ごとに更新するバックグラウンドループ"""
+        while True:
+            self._now_cache = datetime.utcnow()
+            await asyncio.sleep(1)
+
+    async def _drain_callbacks(self) -> None:
+        """キューからコールバックを取り出してまとめて実行するワーカー"""
+        while True:
+            callbacks, job = await self._cb_queue.get()
+            results = await asyncio.gather(
+                *(callback(job) for callback in callbacks),
+                return_exceptions=True,
+            )
+            for res in results:
+                if isinstance(res, BaseException):
+                    logger.error(
+                        f"Callback failed for job {job.job_id}: {res!r}"
+                    )
+
+    def _ensure_background_tasks(self) -> None:
+        """時刻更新・コールバック実行ループを起動（イベントループ内で初回利用時に開始）"""
+        if self._ticker is None or self._ticker.done():
+            self._now_cache = datetime.utcnow()
+            self._ticker = asyncio.create_task(self._tick())
+        if self._cb_worker is None or self._cb_worker.done():
+            self._cb_worker = asyncio.create_task(self._drain_callbacks())
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def _cleanup_loop(self) -> None:
+        """5 分ごとに期限切れの完了ジョブを削除するバックグラウンドループ"""
+        while True:
+            await asyncio.sleep(300)
+            try:
+                await self.cleanup_completed_jobs()
+            except Exception:
+                logger.exception("Periodic job cleanup failed")
 
     async def create_job(
         self,
@@ -108,8 +199,10 @@ class JobManager:
         Returns:
             UUID: 作成されたジョブの ID
         """
+        self._ensure_background_tasks()
+
         job_id = uuid4()
-        now = datetime.utcnow()
+        now = self._now_cache
 
         job_info = JobInfo(
             job_id=job_id,
@@ -121,18 +214,21 @@ class JobManager:
             metadata=metadata or {},
         )
 
+        key = job_id.int
         async with self._lock:
-            self._jobs[job_id] = job_info
-            self._callbacks[job_id] = []
+            self._jobs[key] = job_info
+            self._by_user[user_id].add(key)
+            self._active.add(key)
+            self._callbacks[key] = []
             if on_progress:
-                self._callbacks[job_id].append(on_progress)
+                self._callbacks[key].append(on_progress)
             if on_complete:
-                self._callbacks[job_id].append(on_complete)
+                self._callbacks[key].append(on_complete)
 
         # タスクをラップして実行
         wrapped_task = self._wrap_task(job_id, task)
         async_task = asyncio.create_task(wrapped_task)
-        self._tasks[job_id] = async_task
+        self._tasks[key] = async_task
 
         logger.info(f"Job created: {job_id} (type: {job_type})")
         return job_id
@@ -187,49 +283,94 @@ class JobManager:
             result: 実行結果
             error: エラーメッセージ
         """
-        async with self._lock:
-            if job_id not in self._jobs:
-                logger.warning(f"Job not found: {job_id}")
-                return
-
-            job = self._jobs[job_id]
-
-            if status is not None:
-                job.status = status
-            if progress is not None:
-                job.progress = min(max(progress, 0.0), 1.0)
-            if message is not None:
-                job.message = message
-            if result is not None:
-                job.result = result
-            if error is not None:
-                job.error = error
-
-            job.updated_at = datetime.utcnow()
-
-        # コールバック呼び出し（ロック外で実行）
-        callbacks = self._callbacks.get(job_id, [])
-        for callback in callbacks:
-            try:
-                await callback(job)
-            except Exception:
-                logger.exception(f"Callback failed for job {job_id}")
+        # ホットパスのためロックは取らない。CPython では単一の属性代入や
+        # set の add/discard は GIL 下でアトミックであり、フィールド更新だけの
+        # この処理を self._lock で直列化する必要はない
+        # （構造を変える create_job / cleanup_completed_jobs はロックを保持する）。
+        key = job_id.int
+        job = self._jobs.get(key)
+        if job is None:
+            logger.warning(f"Job not found: {job_id}")
+            return
+
+        if status is not None:
+            was_active = job.status in (JobStatus.PENDING, JobStatus.RUNNING)
+            job.status = status
+            # アクティブ集合を状態遷移に追従させる
+            if status in (JobStatus.PENDING, JobStatus.RUNNING):
+                self._active.add(key)
+            else:
+                self._active.discard(key)
+                if was_active:
+                    # 終了時刻順にクリーンアップ対象として記録
+                    self._completed_order.append((self._now_cache, key))
+        if progress is not None:
+            job.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            job.message = message
+        if result is not None:
+            job.result = result
+        if error is not None:
+            job.error = error
+
+        job.updated_at = self._now_cache
+        job._cached_json = None
+
+        # コールバックはワーカーに引き渡すだけで即座に戻る。
+        # 実行中の変更が波及しないようスナップショットを渡す
+        callbacks = self._callbacks.get(key)
+        if callbacks:
+            self._cb_queue.put_nowait((list(callbacks), replace(job)))
+
+        # ステータス遷移を待っている側に通知
+        if status is not None:
+            async with self._cond:
+                self._cond.notify_all()
 
     def get_job(self, job_id: UUID) -> Optional[JobInfo]:
         """ジョブ情報を取得"""
-        return self._jobs.get(job_id)
+        return self._jobs.get(job_id.int)
+
+    async def wait_for_status(
+        self, job_id: UUID, status: JobStatus, timeout: float = 1.0
+    ) -> JobInfo:
+        """
+        ジョブが指定ステータスに遷移するまで待機
+
+        sleep によるポーリングの代わりに、update_job からの
+        ブロードキャストを受けて遷移した瞬間に戻る。
+
+        Args:
+            job_id: 待機するジョブの ID
+            status: 待機対象のステータス
+            timeout: 最大待機時間（秒）
+
+        Returns:
+            JobInfo: 遷移後のジョブ情報
+
+        Raises:
+            asyncio.TimeoutError: 時間内に遷移しなかった場合
+        """
+
+        key = job_id.int
+
+        async def _wait() -> JobInfo:
+            async with self._cond:
+                while True:
+                    job = self._jobs.get(key)
+                    if job is not None and job.status == status:
+                        return job
+                    await self._cond.wait()
+
+        return await asyncio.wait_for(_wait(), timeout=timeout)
 
     def get_jobs_by_user(self, user_id: UUID) -> list[JobInfo]:
         """ユーザーのジョブ一覧を取得"""
-        return [job for job in self._jobs.values() if job.user_id == user_id]
+        return [self._jobs[key] for key in self._by_user.get(user_id, ())]
 
     def get_active_jobs(self) -> list[JobInfo]:
         """実行中のジョブ一覧を取得"""
-        return [
-            job
-            for job in self._jobs.values()
-            if job.status in (JobStatus.PENDING, JobStatus.RUNNING)
-        ]
+        return [self._jobs[key] for key in self._active]
 
     async def cancel_job(self, job_id: UUID) -> bool:
         """
@@ -241,16 +382,26 @@ class JobManager:
         Returns:
             bool: キャンセルが成功したかどうか
         """
-        if job_id not in self._tasks:
+        key = job_id.int
+        task = self._tasks.get(key)
+        if task is None or task.done():
             return False
 
-        task = self._tasks[job_id]
-        if not task.done():
-            task.cancel()
-            logger.info(f"Job cancelled: {job_id}")
-            return True
+        task.cancel()
 
-        return False
+        # _wrap_task の CancelledError 処理がステータスを CANCELLED に
+        # 更新し終えるまで待つ。呼び出し側が直後に get_job しても
+        # RUNNING のままのジョブを見ないようにするため
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=2.0)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            pass
+
+        # 終了済みタスクへの参照をシャットダウンまで抱え込まない
+        self._tasks.pop(key, None)
+
+        logger.info(f"Job cancelled: {job_id}")
+        return True
 
     async def cleanup_completed_jobs(self, max_age_hours: int = 24) -> int:
         """
@@ -263,35 +414,49 @@ class JobManager:
             int: 削除されたジョブ数
         """
         now = datetime.utcnow()
-        to_remove: list[UUID] = []
+        max_age = timedelta(hours=max_age_hours)
+        removed = 0
 
+        # _completed_order は終了時刻順なので、左端から期限切れの分だけ
+        # 取り出せばよい（期限内のジョブには一切触れない）
         async with self._lock:
-            for job_id, job in self._jobs.items():
-                if job.status in (
-                    JobStatus.COMPLETED,
-                    JobStatus.FAILED,
-                    JobStatus.CANCELLED,
-                ):
-                    age_hours = (now - job.updated_at).total_seconds() / 3600
-                    if age_hours > max_age_hours:
-                        to_remove.append(job_id)
-
-            for job_id in to_remove:
-                del self._jobs[job_id]
-                self._tasks.pop(job_id, None)
-                self._callbacks.pop(job_id, None)
-
-        logger.info(f"Cleaned up {len(to_remove)} completed jobs")
-        return len(to_remove)
+            while self._completed_order:
+                finished_at, key = self._completed_order[0]
+                if now - finished_at <= max_age:
+                    break
+                self._completed_order.popleft()
+
+                job = self._jobs.pop(key, None)
+                if job is None:
+                    continue
+                self._tasks.pop(key, None)
+                self._callbacks.pop(key, None)
+                self._active.discard(key)
+                user_jobs = self._by_user.get(job.user_id)
+                if user_jobs is not None:
+                    user_jobs.discard(key)
+                    if not user_jobs:
+                        del self._by_user[job.user_id]
+                removed += 1
+
+        logger.info(f"Cleaned up {removed} completed jobs")
+        return removed
 
     async def shutdown(self) -> None:
         """マネージャーをシャットダウンし、実行中のジョブをキャンセル"""
         logger.info("Shutting down JobManager...")
 
-        for job_id, task in self._tasks.items():
+        if self._ticker is not None and not self._ticker.done():
+            self._ticker.cancel()
+        if self._cb_worker is not None and not self._cb_worker.done():
+            self._cb_worker.cancel()
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            self._cleanup_task.cancel()
+
+        for key, task in self._tasks.items():
             if not task.done():
                 task.cancel()
-                logger.info(f"Cancelled job on shutdown: {job_id}")
+                logger.info(f"Cancelled job on shutdown: {UUID(int=key)}")
 
         # すべてのタスクの完了を待機
         if self._tasks:
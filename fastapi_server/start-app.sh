@@ -6,5 +6,5 @@ export UV_CACHE_DIR=.uv
 
 uv run python alembic_migration.py  # migrating base to the last change
 
-uv run uvicorn app.main:app --host 0.0.0.0 --port 8080 --proxy-headers --timeout-keep-alive 300
-
+# uvloop + httptools: I/O バウンドなジョブ監視 API のイベントループ性能を底上げ
+uv run uvicorn app.main:app --host 0.0.0.0 --port 8080 --proxy-headers --timeout-keep-alive 300 --loop uvloop --http httptools
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 from datetime import UTC, datetime, timedelta
 from typing import AsyncGenerator, Awaitable, Callable, Generator, TypeVar
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
+import uvloop
 from datarobot.auth.datarobot.oauth import AsyncOAuth
 from datarobot.auth.oauth import OAuthFlowSession, OAuthToken
 from fastapi import FastAPI, Request
@@ -31,11 +34,18 @@ from app.chats import ChatRepository
 from app.config import Config
 from app.db import DBCtx
 from app.deps import Deps, create_deps
+from app.jobs.autopilot import AutoPilotMonitorRegistry
+from app.jobs.manager import JobManager
 from app.messages import MessageRepository
 from app.users.identity import AuthSchema, Identity, IdentityCreate, IdentityRepository
 from app.users.tokens import Tokens
 from app.users.user import User, UserCreate, UserRepository
 
+# Async tests share a single session-scoped event loop (see the
+# asyncio_*_loop_scope options in pyproject.toml) running on uvloop,
+# which avoids per-test loop startup and uses C-level timer scheduling.
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 async def migrate_tables_to_db(db: DBCtx) -> None:
     async with db.engine.begin() as conn:
@@ -68,7 +78,10 @@ def deps(config: Config) -> Deps:
         tokens=AsyncMock(spec=Tokens),
         auth=AsyncMock(spec=AsyncOAuth),
         api_key_validator=AsyncMock(spec=APIKeyValidator),
+        autopilot_registry=AutoPilotMonitorRegistry(),
         db=AsyncMock(spec=DBCtx),
+        http_client=AsyncMock(spec=httpx.AsyncClient),
+        job_manager=JobManager(),
         stream_manager=AsyncMock(spec=AGUIStreamManager),
     )
 
@@ -18,21 +18,82 @@ JobManager Unit Tests
 """
 import asyncio
 from datetime import datetime
-from uuid import uuid4
+from typing import Callable
+from uuid import UUID, uuid4
 
 import pytest
 
 from app.jobs.manager import JobInfo, JobManager, JobStatus
 
 
+async def wait_until(predicate: Callable[[], bool], timeout: float = 1.0) -> None:
+    """条件が成立するまで待機するヘルパー
+
+    固定の asyncio.sleep(0.1...0.5) で「落ち着くのを待つ」代わりに、
+    状態変化が起きた瞬間にテストを進める。
+    """
+
+    async def _poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(_poll(), timeout=timeout)
+
+
+# テストごとにクロージャを定義し直さず、モジュールレベルの
+# コルーチン関数を共有する（呼び出し時に新しいコルーチンが作られる）
+def get_existing_job(job_manager: JobManager, job_id) -> JobInfo:
+    """存在が保証されているジョブを取得するヘルパー
+
+    テスト本体から `assert job is not None` の繰り返しを取り除く。
+    """
+    job = job_manager.get_job(job_id)
+    assert job is not None
+    return job
+
+
+async def quick_task() -> str:
+    """すぐに完了するタスク"""
+    return "done"
+
+
+async def long_task(duration: float = 10) -> str:
+    """指定時間スリープするタスク（実行中状態を維持するために使う）"""
+    await asyncio.sleep(duration)
+    return "done"
+
+
 class TestJobManager:
     """JobManager のテストクラス"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def job_manager(self) -> JobManager:
-        """テスト用 JobManager インスタンス"""
+        """テスト用 JobManager インスタンス（クラス内で共有し、テスト間でリセット）"""
         return JobManager()
 
+    @pytest.fixture(autouse=True)
+    async def _reset_job_manager(self, job_manager: JobManager):
+        """各テスト後にマネージャーの状態をリセットする
+
+        インスタンス生成を全テストで共有しつつ、ジョブ・タスク・
+        イベントループに紐づくプリミティブを毎回作り直す。
+        """
+        yield
+        await job_manager.shutdown()
+        job_manager._jobs.clear()
+        job_manager._tasks.clear()
+        job_manager._callbacks.clear()
+        job_manager._by_user.clear()
+        job_manager._active.clear()
+        job_manager._completed_order.clear()
+        # ループ境界をまたげないプリミティブは作り直す
+        job_manager._ticker = None
+        job_manager._cb_worker = None
+        job_manager._cleanup_task = None
+        job_manager._cb_queue = asyncio.Queue()
+        job_manager._lock = asyncio.Lock()
+        job_manager._cond = asyncio.Condition()
+
     @pytest.fixture
     def user_id(self):
         """テスト用ユーザー ID"""
@@ -47,39 +108,29 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """ジョブ作成時に UUID が返されることを確認"""
-
-        async def dummy_task():
-            return "completed"
-
         job_id = await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
-            task=dummy_task(),
+            task=quick_task(),
         )
 
         assert job_id is not None
-        assert isinstance(job_id, type(uuid4()))
+        assert isinstance(job_id, UUID)
 
     @pytest.mark.asyncio
     async def test_create_job_stores_job_info(
         self, job_manager: JobManager, user_id
     ):
         """ジョブ情報が正しく保存されることを確認"""
-
-        async def dummy_task():
-            await asyncio.sleep(0.1)
-            return "done"
-
         job_id = await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
-            task=dummy_task(),
+            task=long_task(0.1),
             metadata={"key": "value"},
         )
 
-        job = job_manager.get_job(job_id)
+        job = get_existing_job(job_manager, job_id)
 
-        assert job is not None
         assert job.job_type == "test_job"
         assert job.user_id == user_id
         assert job.metadata == {"key": "value"}
@@ -89,59 +140,62 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """コールバックが呼び出されることを確認"""
-        callback_called = []
+        # リストへの append をポーリングする代わりに Queue で受け取り、
+        # コールバックが届いた瞬間にテストを進める
+        statuses_queue: asyncio.Queue[JobStatus] = asyncio.Queue()
 
         async def on_progress(job: JobInfo):
-            callback_called.append(job.status)
+            await statuses_queue.put(job.status)
 
-        async def quick_task():
-            return "done"
-
-        job_id = await job_manager.create_job(
+        await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
             task=quick_task(),
             on_progress=on_progress,
         )
 
-        # タスク完了を待つ
-        await asyncio.sleep(0.2)
+        # COMPLETED が届くまでキューから取り出す
+        statuses: list[JobStatus] = []
+        while JobStatus.COMPLETED not in statuses:
+            statuses.append(
+                await asyncio.wait_for(statuses_queue.get(), timeout=1.0)
+            )
 
         # RUNNING と COMPLETED が呼ばれるはず
-        assert JobStatus.RUNNING in callback_called
-        assert JobStatus.COMPLETED in callback_called
+        assert JobStatus.RUNNING in statuses
+        assert JobStatus.COMPLETED in statuses
 
     # ─────────────────────────────────────────────────────────────
     # get_job テスト
     # ─────────────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
-    async def test_get_job_returns_none_for_unknown_id(
-        self, job_manager: JobManager
+    @pytest.mark.parametrize(
+        "method, expected",
+        [("get_job", None), ("cancel_job", False)],
+    )
+    async def test_unknown_job_id_returns_default(
+        self, job_manager: JobManager, method: str, expected
     ):
-        """存在しないジョブ ID で None が返ることを確認"""
-        result = job_manager.get_job(uuid4())
-        assert result is None
+        """存在しないジョブ ID でデフォルト値が返ることを確認"""
+        result = getattr(job_manager, method)(uuid4())
+        if asyncio.iscoroutine(result):
+            result = await result
+        assert result is expected
 
     @pytest.mark.asyncio
     async def test_get_job_returns_correct_job(
         self, job_manager: JobManager, user_id
     ):
         """正しいジョブ情報が返されることを確認"""
-
-        async def dummy_task():
-            await asyncio.sleep(0.5)
-            return "done"
-
         job_id = await job_manager.create_job(
             job_type="unique_type",
             user_id=user_id,
-            task=dummy_task(),
+            task=long_task(0.5),
         )
 
-        job = job_manager.get_job(job_id)
+        job = get_existing_job(job_manager, job_id)
 
-        assert job is not None
         assert job.job_id == job_id
         assert job.job_type == "unique_type"
 
@@ -154,11 +208,6 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """進捗更新が反映されることを確認"""
-
-        async def long_task():
-            await asyncio.sleep(10)
-            return "done"
-
         job_id = await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
@@ -167,9 +216,8 @@ class TestJobManager:
 
         await job_manager.update_job(job_id, progress=0.5, message="halfway")
 
-        job = job_manager.get_job(job_id)
+        job = get_existing_job(job_manager, job_id)
 
-        assert job is not None
         assert job.progress == 0.5
         assert job.message == "halfway"
 
@@ -177,31 +225,22 @@ class TestJobManager:
         await job_manager.cancel_job(job_id)
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "raw, clamped",
+        [(1.5, 1.0), (-0.5, 0.0), (0.5, 0.5)],
+    )
     async def test_update_job_clamps_progress(
-        self, job_manager: JobManager, user_id
+        self, job_manager: JobManager, user_id, raw: float, clamped: float
     ):
         """進捗が 0.0 ~ 1.0 の範囲に制限されることを確認"""
-
-        async def long_task():
-            await asyncio.sleep(10)
-            return "done"
-
         job_id = await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
             task=long_task(),
         )
 
-        # 範囲外の値を設定
-        await job_manager.update_job(job_id, progress=1.5)
-        job = job_manager.get_job(job_id)
-        assert job is not None
-        assert job.progress == 1.0
-
-        await job_manager.update_job(job_id, progress=-0.5)
-        job = job_manager.get_job(job_id)
-        assert job is not None
-        assert job.progress == 0.0
+        await job_manager.update_job(job_id, progress=raw)
+        assert get_existing_job(job_manager, job_id).progress == clamped
 
         # クリーンアップ
         await job_manager.cancel_job(job_id)
@@ -215,17 +254,6 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """実行中のタスクがキャンセルされることを確認"""
-        task_completed = []
-
-        async def long_task():
-            try:
-                await asyncio.sleep(10)
-                task_completed.append(True)
-                return "done"
-            except asyncio.CancelledError:
-                task_completed.append(False)
-                raise
-
         job_id = await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
@@ -233,26 +261,12 @@ class TestJobManager:
         )
 
         # タスクが開始するのを待つ
-        await asyncio.sleep(0.1)
-
-        result = await job_manager.cancel_job(job_id)
-        assert result is True
+        await job_manager.wait_for_status(job_id, JobStatus.RUNNING)
 
-        # キャンセル処理を待つ
-        await asyncio.sleep(0.2)
-
-        job = job_manager.get_job(job_id)
-        assert job is not None
-        assert job.status == JobStatus.CANCELLED
-        assert False in task_completed  # タスクはキャンセルされた
-
-    @pytest.mark.asyncio
-    async def test_cancel_job_returns_false_for_unknown_id(
-        self, job_manager: JobManager
-    ):
-        """存在しないジョブ ID でキャンセルが失敗することを確認"""
-        result = await job_manager.cancel_job(uuid4())
-        assert result is False
+        # cancel_job はキャンセル処理の完了まで待つため、戻った時点で
+        # ステータスは確定している（センチネルリストでの追跡は不要）
+        assert await job_manager.cancel_job(job_id) is True
+        assert get_existing_job(job_manager, job_id).status == JobStatus.CANCELLED
 
     # ─────────────────────────────────────────────────────────────
     # get_jobs_by_user テスト
@@ -266,18 +280,17 @@ class TestJobManager:
         user1 = uuid4()
         user2 = uuid4()
 
-        async def dummy_task():
-            await asyncio.sleep(1)
-            return "done"
-
-        await job_manager.create_job(
-            job_type="job1", user_id=user1, task=dummy_task()
-        )
-        await job_manager.create_job(
-            job_type="job2", user_id=user1, task=dummy_task()
-        )
-        await job_manager.create_job(
-            job_type="job3", user_id=user2, task=dummy_task()
+        # 3 件のジョブ登録を直列に await せず並行して行う
+        await asyncio.gather(
+            job_manager.create_job(
+                job_type="job1", user_id=user1, task=long_task(1)
+            ),
+            job_manager.create_job(
+                job_type="job2", user_id=user1, task=long_task(1)
+            ),
+            job_manager.create_job(
+                job_type="job3", user_id=user2, task=long_task(1)
+            ),
         )
 
         user1_jobs = job_manager.get_jobs_by_user(user1)
@@ -300,17 +313,9 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """実行中のジョブのみが返されることを確認"""
-
-        async def long_task():
-            await asyncio.sleep(5)
-            return "done"
-
-        async def quick_task():
-            return "done"
-
         # 長いタスク（実行中のまま）
         await job_manager.create_job(
-            job_type="long", user_id=user_id, task=long_task()
+            job_type="long", user_id=user_id, task=long_task(5)
         )
 
         # 短いタスク（すぐ完了）
@@ -319,7 +324,7 @@ class TestJobManager:
         )
 
         # 短いタスクが完了するのを待つ
-        await asyncio.sleep(0.2)
+        await wait_until(lambda: len(job_manager.get_active_jobs()) == 1)
 
         active_jobs = job_manager.get_active_jobs()
 
@@ -351,11 +356,8 @@ class TestJobManager:
         )
 
         # タスク完了を待つ
-        await asyncio.sleep(0.3)
+        job = await job_manager.wait_for_status(job_id, JobStatus.COMPLETED)
 
-        job = job_manager.get_job(job_id)
-
-        assert job is not None
         assert job.status == JobStatus.COMPLETED
         assert job.progress == 1.0
         assert job.result == {"result": "success"}
@@ -377,11 +379,8 @@ class TestJobManager:
         )
 
         # タスク完了を待つ
-        await asyncio.sleep(0.3)
-
-        job = job_manager.get_job(job_id)
+        job = await job_manager.wait_for_status(job_id, JobStatus.FAILED)
 
-        assert job is not None
         assert job.status == JobStatus.FAILED
         assert "Something went wrong" in (job.error or "")
 
@@ -394,10 +393,6 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """古い完了済みジョブが削除されることを確認"""
-
-        async def quick_task():
-            return "done"
-
         job_id = await job_manager.create_job(
             job_type="test_job",
             user_id=user_id,
@@ -405,7 +400,7 @@ class TestJobManager:
         )
 
         # タスク完了を待つ
-        await asyncio.sleep(0.2)
+        await job_manager.wait_for_status(job_id, JobStatus.COMPLETED)
 
         # 0時間でクリーンアップ（すべての完了ジョブを削除）
         removed = await job_manager.cleanup_completed_jobs(max_age_hours=0)
@@ -422,27 +417,22 @@ class TestJobManager:
         self, job_manager: JobManager, user_id
     ):
         """シャットダウン時にすべてのジョブがキャンセルされることを確認"""
-
-        async def long_task():
-            await asyncio.sleep(10)
-            return "done"
-
-        job_id1 = await job_manager.create_job(
-            job_type="job1", user_id=user_id, task=long_task()
-        )
-        job_id2 = await job_manager.create_job(
-            job_type="job2", user_id=user_id, task=long_task()
+        job_id1, job_id2 = await asyncio.gather(
+            job_manager.create_job(
+                job_type="job1", user_id=user_id, task=long_task()
+            ),
+            job_manager.create_job(
+                job_type="job2", user_id=user_id, task=long_task()
+            ),
         )
 
         # タスクが開始するのを待つ
-        await asyncio.sleep(0.1)
+        await asyncio.gather(
+            job_manager.wait_for_status(job_id1, JobStatus.RUNNING),
+            job_manager.wait_for_status(job_id2, JobStatus.RUNNING),
+        )
 
         await job_manager.shutdown()
 
-        job1 = job_manager.get_job(job_id1)
-        job2 = job_manager.get_job(job_id2)
-
-        assert job1 is not None
-        assert job2 is not None
-        assert job1.status == JobStatus.CANCELLED
-        assert job2.status == JobStatus.CANCELLED
+        assert get_existing_job(job_manager, job_id1).status == JobStatus.CANCELLED
+        assert get_existing_job(job_manager, job_id2).status == JobStatus.CANCELLED
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional
+import functools
+from typing import Any
 
 from datarobot_genai.drmcp import (
     RUNTIME_PARAM_ENV_VAR_NAME_PREFIX,
@@ -21,6 +22,10 @@ from datarobot_genai.drmcp import (
 from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Alias strings are concatenated once at import time rather than on
+# every UserAppConfig construction.
+_USER_NAME_ENV = RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "USER_NAME"
+
 
 class UserAppConfig(BaseSettings):
     """User-specific application configuration."""
@@ -29,7 +34,7 @@ class UserAppConfig(BaseSettings):
     user_name: str = Field(
         default="default-user",
         validation_alias=AliasChoices(
-            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "USER_NAME",
+            _USER_NAME_ENV,
             "USER_NAME",
         ),
         description="Name of the user being used",
@@ -42,6 +47,10 @@ class UserAppConfig(BaseSettings):
     @classmethod
     def validate_user_runtime_params(cls, v: Any) -> Any:
         """Validate user runtime parameters."""
+        # Plain env-var strings don't need the runtime-param JSON unwrap;
+        # only values in the {"type": ..., "payload": ...} shape do.
+        if isinstance(v, str) and not v.startswith("{"):
+            return v
         return extract_datarobot_runtime_param_payload(v)
 
     model_config = SettingsConfigDict(
@@ -52,13 +61,7 @@ class UserAppConfig(BaseSettings):
     )
 
 
-# Global configuration instance
-_user_config: Optional[UserAppConfig] = None
-
-
+@functools.cache
 def get_user_config() -> UserAppConfig:
     """Get the global user configuration instance."""
-    global _user_config
-    if _user_config is None:
-        _user_config = UserAppConfig()
-    return _user_config
+    return UserAppConfig()